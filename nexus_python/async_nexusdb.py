@@ -0,0 +1,277 @@
+import asyncio
+import logging
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - httpx is only needed for AsyncNexusDB
+    httpx = None
+
+try:
+    import h2  # noqa: F401
+
+    _HTTP2_AVAILABLE = True
+except ImportError:  # pragma: no cover - HTTP/2 support is optional
+    _HTTP2_AVAILABLE = False
+
+from nexus_python.nexusdb import _dumps, _NexusBase, logger
+
+
+class AsyncNexusDB(_NexusBase):
+    """
+    asyncio client for NexusDB, mirroring the query methods of ``NexusDB``.
+
+    Independent queries can be awaited together (e.g. with ``asyncio.gather``)
+    so they overlap on a shared connection pool instead of running one RTT at a
+    time. Use ``async with AsyncNexusDB() as db:`` or call :meth:`aclose`.
+    """
+
+    __slots__ = ("_client",)
+
+    def __init__(
+        self,
+        api_key=None,
+        compression=None,
+        compress_threshold=8192,
+        cache_ttl=0,
+        cache_backend=None,
+        http2=_HTTP2_AVAILABLE,
+        timeout=None,
+    ):
+        """
+        :param api_key: The API key; defaults to the NEXUSDB_API_KEY environment variable.
+        :param compression: Optional Content-Encoding for large request bodies
+                            ("gzip", "zstd" or "br"); the server must accept it.
+        :param compress_threshold: Minimum body size in bytes before compressing.
+        :param cache_ttl: Seconds to reuse responses of identical read queries;
+                          0 disables caching. See ``NexusDB``.
+        :param cache_backend: Optional mapping used as the cache.
+        :param http2: Multiplex queries over HTTP/2; defaults to on when h2 is installed.
+        :param timeout: Optional request timeout in seconds (or an ``httpx.Timeout``);
+                        by default requests wait indefinitely, like ``NexusDB``.
+        """
+        if httpx is None:
+            raise ImportError("httpx is required to use AsyncNexusDB.")
+        super().__init__(
+            api_key, compression, compress_threshold, cache_ttl, cache_backend
+        )
+
+        headers = {k: v for k, v in self.headers.items() if v is not None}
+        transport = httpx.AsyncHTTPTransport(
+            http2=http2,
+            limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+            retries=3,
+        )
+        self._client = httpx.AsyncClient(
+            headers=headers, transport=transport, timeout=timeout
+        )
+
+    async def aclose(self):
+        """Close the underlying connection pool."""
+        await self._client.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.aclose()
+
+    async def _send(self, payload, headers=None):
+        """POST a query payload to the API over the shared client."""
+        body, headers = self._encode(payload, headers)
+        return await self._client.post(self.base_url, content=body, headers=headers)
+
+    async def _fetch(self, payload):
+        """Send a read query and return the response body, cached if enabled."""
+        if not self.cache_ttl:
+            return (await self._send(payload)).content
+
+        key = self._cache_key(payload)
+        body, headers = self._cache_check(key)
+        if body is not None:
+            return body
+        return self._cache_store(key, await self._send(payload, headers=headers))
+
+    async def _post(
+        self,
+        payload,
+        process=False,
+        tabulate=False,
+        include_types=False,
+        tablefmt="simple",
+    ):
+        """Send a query and return its result; see ``NexusDB._post``."""
+        if not process:
+            text = (await self._send(payload)).text
+            logger.debug("%s response: %s", payload["query_type"], text)
+            return text
+
+        body = await self._fetch(payload)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "%s response: %s",
+                payload["query_type"],
+                body.decode(errors="replace"),
+            )
+        return self._process_response(body, tabulate, include_types, tablefmt)
+
+    async def create(self, relation_name, columns):
+        """Creates a new relation with the specified columns."""
+        return await self._post(self._build_create(relation_name, columns))
+
+    async def modify_data(self, operation_type, relation_name, *args, **kwargs):
+        """Modifies data in the specified relation; see ``NexusDB.modify_data``."""
+        payload = self._build_modify(operation_type, relation_name, *args, **kwargs)
+        return await self._post(payload)
+
+    async def insert(self, relation_name, *args, **kwargs):
+        return await self.modify_data("Insert", relation_name, *args, **kwargs)
+
+    async def upsert(self, relation_name, *args, **kwargs):
+        return await self.modify_data("Upsert", relation_name, *args, **kwargs)
+
+    async def update(self, relation_name, *args, **kwargs):
+        return await self.modify_data("Update", relation_name, *args, **kwargs)
+
+    async def insert_columnar(self, relation_name, fields, columns):
+        """Inserts rows given column by column; see ``NexusDB.insert_columnar``."""
+        return await self._post(
+            self._build_insert_columnar(relation_name, fields, columns)
+        )
+
+    async def _modify_many(
+        self, operation_type, relation_name, fields, rows, batch_size, max_concurrency
+    ):
+        head, batches = self._build_batches(
+            operation_type, relation_name, fields, rows, batch_size, max_concurrency
+        )
+        numbered_batches = enumerate(batches)
+        responses = {}
+
+        # Each worker pulls the next batch only once its previous one is done,
+        # so at most max_concurrency batches are built and in flight at a time
+        async def send_batches():
+            for index, batch in numbered_batches:
+                responses[index] = await self._send_batch(head, batch)
+
+        workers = [
+            asyncio.ensure_future(send_batches()) for _ in range(max_concurrency)
+        ]
+        try:
+            await asyncio.gather(*workers)
+        except BaseException:
+            for worker in workers:
+                worker.cancel()
+            raise
+        return [responses[index] for index in range(len(responses))]
+
+    async def _send_batch(self, head, batch):
+        """Send one batch of rows after the pre-serialized payload ``head``."""
+        response = await self._send(head + _dumps(batch) + b"}")
+        logger.debug("Batch of %d rows response: %s", len(batch), response.text)
+        return response.text
+
+    async def insert_many(
+        self, relation_name, fields, rows, batch_size=1000, max_concurrency=1
+    ):
+        """
+        Inserts rows in batches of ``batch_size``; see ``NexusDB.insert_many``.
+
+        Batches are sent one at a time by default. With a ``max_concurrency``
+        above one, that many are sent concurrently and may reach the server out
+        of order.
+
+        :return: A list with the server's response for each batch, in order.
+        """
+        return await self._modify_many(
+            "Insert", relation_name, fields, rows, batch_size, max_concurrency
+        )
+
+    async def upsert_many(
+        self, relation_name, fields, rows, batch_size=1000, max_concurrency=1
+    ):
+        """Upserts rows in batches; see :meth:`insert_many`."""
+        return await self._modify_many(
+            "Upsert", relation_name, fields, rows, batch_size, max_concurrency
+        )
+
+    async def update_many(
+        self, relation_name, fields, rows, batch_size=1000, max_concurrency=1
+    ):
+        """Updates rows in batches; see :meth:`insert_many`."""
+        return await self._modify_many(
+            "Update", relation_name, fields, rows, batch_size, max_concurrency
+        )
+
+    async def lookup(
+        self,
+        relation_name,
+        fields=None,
+        condition="",
+        tabulate=False,
+        include_types=False,
+        tablefmt="simple",
+    ):
+        data = self._build_lookup(relation_name, fields, condition)
+        return await self._post(data, True, tabulate, include_types, tablefmt)
+
+    async def join(
+        self,
+        join_type,
+        relations,
+        return_fields,
+        option=None,
+        tabulate=False,
+        include_types=False,
+        tablefmt="simple",
+    ):
+        data = self._build_join(join_type, relations, return_fields, option)
+        return await self._post(data, True, tabulate, include_types, tablefmt)
+
+    async def delete(self, relation_name, condition):
+        """Deletes data from the specified relation where condition is met."""
+        return await self._post(self._build_delete(relation_name, condition))
+
+    async def edit_fields(self, relation_name, *args, **kwargs):
+        """Edits columns in the specified relation; see ``NexusDB.edit_fields``."""
+        return await self._post(self._build_edit_fields(relation_name, *args, **kwargs))
+
+    async def vector_search(
+        self,
+        query_vector,
+        access_keys=None,
+        search_radius=None,
+        number_of_results=None,
+        filter_statement=None,
+        tabulate=False,
+        include_types=False,
+        tablefmt="simple",
+        embedding_dtype=None,
+    ):
+        query_payload = self._build_vector_search(
+            query_vector,
+            access_keys,
+            search_radius,
+            number_of_results,
+            filter_statement,
+            embedding_dtype,
+        )
+        return await self._post(query_payload, True, tabulate, include_types, tablefmt)
+
+    async def recursive_query(
+        self,
+        relation_name,
+        source_field,
+        target_field,
+        starting_condition,
+        tabulate=False,
+        include_types=False,
+        tablefmt="simple",
+    ):
+        data = self._build_recursive_query(
+            relation_name, source_field, target_field, starting_condition
+        )
+        return await self._post(data, True, tabulate, include_types, tablefmt)
+
+    async def batch(self, operations):
+        """Sends several queries in a single request; see ``NexusDB.batch``."""
+        return await self._post({"query_type": "Batch", "operations": operations})
@@ -1,9 +1,41 @@
+import base64
+import functools
+import gzip
+import hashlib
 import json
 import logging
 import os
+import threading
+import time
+import weakref
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 
 import requests
+from requests.adapters import HTTPAdapter
 from tabulate import tabulate
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - only needed for compression="zstd"
+    zstandard = None
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - only needed for compression="br"
+    brotli = None
+
+try:
+    import ijson
+except ImportError:  # pragma: no cover - only needed for incremental parsing
+    ijson = None
 
 # Initialize logger
 logger = logging.getLogger("nexusdb")
@@ -11,8 +43,482 @@ logger.setLevel(logging.WARNING)
 logger.addHandler(logging.NullHandler())
 
 
-class NexusDB:
-    def __init__(self, api_key=None):
+def _default(obj):
+    # numpy arrays and scalars are converted to plain Python values
+    if hasattr(obj, "tolist"):
+        return obj.tolist()
+    raise TypeError(
+        f"Object of type {type(obj).__name__} is not JSON serializable"
+    )
+
+
+def _json_dumps(obj):
+    """Serialize ``obj`` to compact JSON bytes with the standard library."""
+    return json.dumps(obj, separators=(",", ":"), default=_default).encode()
+
+
+def _json_dumps_indented(obj):
+    """Serialize ``obj`` to indented JSON text with the standard library."""
+    return json.dumps(obj, indent=2, default=_default)
+
+
+if orjson is not None:
+    _ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+    def _dumps(obj):
+        """Serialize ``obj`` to compact JSON bytes, including numpy arrays."""
+        try:
+            return orjson.dumps(obj, default=_default, option=_ORJSON_OPTIONS)
+        except TypeError:
+            # orjson rejects some input the stdlib accepts, such as integers
+            # beyond 64 bits
+            return _json_dumps(obj)
+
+    def _loads(data):
+        """Deserialize JSON from bytes or str."""
+        return orjson.loads(data)
+
+    def _dumps_indented(obj):
+        """Serialize ``obj`` to indented JSON text, for logging."""
+        try:
+            return orjson.dumps(
+                obj,
+                default=_default,
+                option=_ORJSON_OPTIONS | orjson.OPT_INDENT_2,
+            ).decode()
+        except TypeError:
+            return _json_dumps_indented(obj)
+
+else:
+    _dumps = _json_dumps
+    _loads = json.loads
+    _dumps_indented = _json_dumps_indented
+
+
+# Responses smaller than this are parsed in one go even when ijson is available,
+# since the per-event overhead of incremental parsing outweighs the memory saved
+_INCREMENTAL_PARSE_THRESHOLD = 1 << 20
+
+# Upper bound on entries kept by the default in-process response cache
+_CACHE_MAXSIZE = 1024
+
+# Request body compressors, keyed by their Content-Encoding name. Levels are
+# kept low so compressing stays cheaper than sending the bytes.
+_COMPRESSORS = {
+    "gzip": lambda body: gzip.compress(body, compresslevel=1),
+    "zstd": lambda body: zstandard.ZstdCompressor(level=3).compress(body),
+    "br": lambda body: brotli.compress(body, quality=4),
+}
+
+
+def _encode_embeddings(embeddings, embedding_dtype):
+    """
+    Pack ``embeddings`` as little-endian binary in base64 for compact transport.
+
+    float32 is lossless and about 4x smaller than a JSON float array with no
+    float parsing on the server; float16 halves that again; int8 uses symmetric
+    scalar quantization (``value ~= code * scale``) and quarters it.
+    """
+    if embedding_dtype not in ("float32", "float16", "int8"):
+        raise ValueError(
+            'embedding_dtype must be None, "float32", "float16" or "int8".'
+        )
+    # Imported here so importing the client does not pay for numpy
+    try:
+        import numpy as np
+    except ImportError:
+        raise ImportError("numpy is required to use embedding_dtype.") from None
+
+    array = np.asarray(embeddings, dtype=np.float32)
+    if embedding_dtype == "float32":
+        return {
+            "dtype": "f32",
+            "dim": array.size,
+            "b64": base64.b64encode(array.astype("<f4").tobytes()).decode(),
+        }
+    if embedding_dtype == "float16":
+        return {
+            "dtype": "f16",
+            "dim": array.size,
+            "b64": base64.b64encode(array.astype("<f2").tobytes()).decode(),
+        }
+    max_abs = float(np.abs(array).max()) if array.size else 0.0
+    scale = max_abs / 127 if max_abs else 1.0
+    codes = np.round(array / scale).astype(np.int8)
+    return {
+        "dtype": "i8",
+        "dim": array.size,
+        "scale": scale,
+        "b64": base64.b64encode(codes.tobytes()).decode(),
+    }
+
+
+def _encode_column(column):
+    """
+    Dictionary-encode a column of strings when most of its values repeat.
+
+    A column whose distinct strings make up less than half of it is sent as
+    ``{"dict": [distinct strings], "codes": [index per value]}``, so repeated
+    strings are written once; any other column is sent as a plain list.
+    """
+    column = list(column)
+    if not column or not all(isinstance(value, str) for value in column):
+        return column
+
+    codes_by_value = {}
+    codes = [codes_by_value.setdefault(value, len(codes_by_value)) for value in column]
+    if len(codes_by_value) / len(column) >= 0.5:
+        return column
+    return {"dict": list(codes_by_value), "codes": codes}
+
+
+def _extract_num(value):
+    if "Int" in value:
+        return value["Int"], "Int"
+    if "Float" in value:
+        return value["Float"], "Float"
+    return None
+
+
+def _extract_list(value):
+    """Extract the plain values of a List cell, walking nested lists with a stack."""
+    # Lists without tagged cells (e.g. raw embeddings) are already plain values
+    if dict not in map(type, value):
+        return value
+
+    result = []
+    stack = [(iter(value), result)]
+    while stack:
+        items, out = stack[-1]
+        for item in items:
+            if isinstance(item, dict) and next(iter(item), None) == "List":
+                nested_value = item["List"]
+                if dict not in map(type, nested_value):
+                    out.append(nested_value)
+                    continue
+                nested = []
+                out.append(nested)
+                stack.append((iter(nested_value), nested))
+                break
+            out.append(_simplify_cell(item))
+        else:
+            stack.pop()
+    return result
+
+
+# Maps a cell's type tag to a function returning its (value, type) pair
+_EXTRACTORS = {
+    "Num": _extract_num,
+    "Str": lambda value: (value, "Str"),
+    "Bool": lambda value: (value, "Bool"),
+    "Uuid": lambda value: (value, "Uuid"),
+    "Json": lambda value: (value, "Json"),
+    "List": lambda value: (_extract_list(value), "List"),
+}
+
+
+def _extract_value_and_type(cell):
+    if isinstance(cell, dict):
+        for key, value in cell.items():
+            extractor = _EXTRACTORS.get(key)
+            if extractor is not None:
+                extracted = extractor(value)
+                if extracted is not None:
+                    return extracted
+        return str(cell), "Unknown"
+    return cell, "Unknown"
+
+
+_PLAIN_TAGS = frozenset(("Str", "Bool", "Uuid", "Json"))
+
+
+def _simplify_cell(
+    cell,
+    _isinstance=isinstance,
+    _len=len,
+    _dict=dict,
+    _plain_tags=_PLAIN_TAGS,
+    _extract=_extract_value_and_type,
+):
+    """
+    Return just the plain value of a cell.
+
+    This is the per-cell hot path, so builtins are bound as default arguments
+    (local lookups) and the common single-tag cells skip the extractor table.
+    """
+    if not _isinstance(cell, _dict):
+        return cell
+    if _len(cell) == 1:
+        ((key, value),) = cell.items()
+        if key in _plain_tags:
+            return value
+        if key == "Num":
+            if "Int" in value:
+                return value["Int"]
+            if "Float" in value:
+                return value["Float"]
+    return _extract(cell)[0]
+
+
+def _iter_rows(source):
+    """
+    Yield the rows of a lookup response as ijson parses them from ``source``.
+
+    Raises ValueError once the body is exhausted if it had no "rows" array,
+    e.g. for an error response.
+    """
+    found_rows = False
+
+    def events():
+        nonlocal found_rows
+        for prefix, event, value in ijson.parse(source, use_float=True):
+            if prefix == "rows" and event == "start_array":
+                found_rows = True
+            yield prefix, event, value
+
+    yield from ijson.items(events(), "rows.item")
+    if not found_rows:
+        raise ValueError("Unexpected lookup response: no rows in response body")
+
+
+@functools.lru_cache(maxsize=256)
+def _typed_headers(headers, column_types):
+    """Build "name (Type)" headers; cached since schemas repeat across queries."""
+    return tuple(
+        f"{header} ({column_type})"
+        for header, column_type in zip(headers, column_types)
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def _string_columns(column_types):
+    """Indices of columns whose cells are strings and never need number parsing."""
+    return tuple(
+        i
+        for i, column_type in enumerate(column_types)
+        if column_type in ("Str", "Uuid")
+    )
+
+
+_FAST_SCALARS = (str, int, float)
+
+
+def _fast_tabulate(rows, headers):
+    """
+    Render rows of scalars as a left-aligned, "simple"-style table.
+
+    A single width pass and ``str.join`` replace tabulate's per-cell type
+    inference and alignment. Returns None when a cell is not a plain one-line
+    scalar, so the caller can fall back to ``tabulate``.
+    """
+    columns = [[str(header)] for header in headers]
+    for row in rows:
+        if len(row) != len(columns):
+            return None
+        for column, value in zip(columns, row):
+            if value is None:
+                value = ""
+            elif not isinstance(value, _FAST_SCALARS):
+                return None
+            else:
+                value = str(value)
+                if "\n" in value:
+                    return None
+            column.append(value)
+
+    widths = [max(map(len, column)) for column in columns]
+    lines = [
+        "  ".join(cell.ljust(width) for cell, width in zip(line, widths)).rstrip()
+        for line in zip(*columns)
+    ]
+    lines.insert(1, "  ".join("-" * width for width in widths))
+    return "\n".join(lines)
+
+
+class _LazyTable:
+    """
+    A tabulated query result that is only rendered when converted to a string.
+
+    Returned by read queries called with ``tabulate="lazy"``. Printing or
+    formatting it behaves like the string returned by ``tabulate=True``, while
+    ``rows`` and ``headers`` stay available for programmatic use without paying
+    for the rendering. It is not a ``str``; call ``str()`` on it for string
+    operations. Pass ``tablefmt="fast"`` for a lightweight renderer that skips
+    tabulate for tables of plain scalars.
+    """
+
+    __slots__ = ("rows", "headers", "tablefmt", "disable_numparse", "_text")
+
+    def __init__(self, rows, headers, tablefmt="simple", disable_numparse=False):
+        self.rows = rows
+        self.headers = headers
+        self.tablefmt = tablefmt
+        self.disable_numparse = disable_numparse
+        self._text = None
+
+    def __str__(self):
+        if self._text is None and self.tablefmt == "fast":
+            self._text = _fast_tabulate(self.rows, self.headers)
+        if self._text is None:
+            tablefmt = "simple" if self.tablefmt == "fast" else self.tablefmt
+            self._text = tabulate(
+                self.rows,
+                headers=self.headers,
+                tablefmt=tablefmt,
+                disable_numparse=self.disable_numparse,
+            )
+        return self._text
+
+    def __repr__(self):
+        return (
+            f"<{type(self).__name__} {len(self.rows)} rows, "
+            f"headers={list(self.headers)!r}>"
+        )
+
+    def __format__(self, format_spec):
+        return format(str(self), format_spec)
+
+    def __eq__(self, other):
+        if isinstance(other, _LazyTable):
+            return str(self) == str(other)
+        if isinstance(other, str):
+            return str(self) == other
+        return NotImplemented
+
+    def __hash__(self):
+        return hash(str(self))
+
+
+# Pooled sessions by API key, each with the number of open clients using it
+_sessions = {}
+_sessions_lock = threading.Lock()
+
+
+def _new_session(api_key):
+    """Create a pooled session authenticated with ``api_key``."""
+    session = requests.Session()
+    session.headers.update({"Content-Type": "application/json", "API-Key": api_key})
+    # Failed connects are retried with backoff; queries are POSTs, which urllib3
+    # does not resend once they reached the server, so writes are never doubled
+    adapter = HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=32,
+        max_retries=Retry(total=3, backoff_factor=0.2),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def _acquire_session(api_key):
+    """
+    Return the pooled session for ``api_key``, shared by every open client using it.
+
+    Reusing TCP/TLS connections across calls and clients avoids reconnecting
+    per query. Each call must be paired with exactly one :func:`_release_session`.
+    """
+    with _sessions_lock:
+        entry = _sessions.get(api_key)
+        if entry is None:
+            entry = _sessions[api_key] = [_new_session(api_key), 0]
+        entry[1] += 1
+        return entry[0]
+
+
+def _release_session(api_key):
+    """Drop one client's use of a session, closing it once no client uses it."""
+    with _sessions_lock:
+        entry = _sessions[api_key]
+        entry[1] -= 1
+        if entry[1]:
+            return
+        del _sessions[api_key]
+    entry[0].close()
+
+
+class _Pipeline:
+    """Collects query payloads for :meth:`NexusDB.pipeline`."""
+
+    __slots__ = ("_db", "operations", "response")
+
+    def __init__(self, db):
+        self._db = db
+        self.operations = []
+        self.response = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.execute()
+
+    def execute(self):
+        """Sends the buffered operations, if any, and returns the server's response."""
+        if self.operations:
+            self.response = self._db.batch(self.operations)
+            self.operations = []
+        return self.response
+
+    def create(self, *args, **kwargs):
+        self.operations.append(self._db._build_create(*args, **kwargs))
+        return self
+
+    def insert(self, *args, **kwargs):
+        self.operations.append(self._db._build_insert(*args, **kwargs))
+        return self
+
+    def upsert(self, *args, **kwargs):
+        self.operations.append(self._db._build_upsert(*args, **kwargs))
+        return self
+
+    def update(self, *args, **kwargs):
+        self.operations.append(self._db._build_update(*args, **kwargs))
+        return self
+
+    def delete(self, *args, **kwargs):
+        self.operations.append(self._db._build_delete(*args, **kwargs))
+        return self
+
+    def edit_fields(self, *args, **kwargs):
+        self.operations.append(self._db._build_edit_fields(*args, **kwargs))
+        return self
+
+
+class _NexusBase:
+    """Configuration, payload builders and response handling shared by the clients."""
+
+    __slots__ = (
+        "compression",
+        "compress_threshold",
+        "cache_ttl",
+        "_cache",
+        "_cache_lock",
+        "base_url",
+        "api_key",
+        "headers",
+    )
+
+    def __init__(
+        self,
+        api_key=None,
+        compression=None,
+        compress_threshold=8192,
+        cache_ttl=0,
+        cache_backend=None,
+    ):
+        if compression is not None and compression not in _COMPRESSORS:
+            raise ValueError('compression must be None, "gzip", "zstd" or "br".')
+        if compression == "zstd" and zstandard is None:
+            raise ImportError("zstandard is required to use zstd compression.")
+        if compression == "br" and brotli is None:
+            raise ImportError("brotli is required to use br compression.")
+        self.compression = compression
+        self.compress_threshold = compress_threshold
+        self.cache_ttl = cache_ttl
+        self._cache = cache_backend if cache_backend is not None else {}
+        self._cache_lock = threading.Lock()
+
         self.base_url = os.environ.get("BASE_URL", "https://api.nexusdb.io/query")
         self.api_key = (
             api_key if api_key is not None else os.environ.get("NEXUSDB_API_KEY")
@@ -20,6 +526,77 @@ class NexusDB:
 
         self.headers = {"Content-Type": "application/json", "API-Key": self.api_key}
 
+    def _encode(self, payload, headers=None):
+        """
+        Serialize a payload, returning the request body and any extra headers.
+
+        Payloads already serialized to bytes are sent as they are.
+        """
+        body = payload if isinstance(payload, bytes) else _dumps(payload)
+        if self.compression is not None and len(body) > self.compress_threshold:
+            body = _COMPRESSORS[self.compression](body)
+            headers = {**(headers or {}), "Content-Encoding": self.compression}
+        return body, headers
+
+    def _cache_key(self, payload):
+        """
+        Key a read query's cached response by endpoint, API key and payload.
+
+        Clients sharing a cache backend across endpoints or API keys must never
+        see each other's results. The API key is hashed so it is not stored in
+        the backend in plain text.
+        """
+        api_key = (self.api_key or "").encode()
+        return b"%s\n%s\n%s" % (
+            self.base_url.encode(),
+            hashlib.sha256(api_key).hexdigest().encode(),
+            _dumps(payload),
+        )
+
+    def _cache_check(self, key):
+        """
+        Look up a cached read response by its encoded query.
+
+        Returns ``(body, None)`` for a fresh entry. Otherwise returns
+        ``(None, headers)``, where headers revalidate a stale entry by its ETag,
+        or are None when there is nothing to revalidate.
+        """
+        entry = self._cache.get(key)
+        if entry is None:
+            return None, None
+        stored_at, etag, body = entry
+        if time.time() - stored_at < self.cache_ttl:
+            return body, None
+        if etag is not None:
+            return None, {"If-None-Match": etag}
+        return None, None
+
+    def _cache_store(self, key, response):
+        """Cache a read response and return its body; a 304 reuses the cached body."""
+        entry = self._cache.get(key)
+        if response.status_code == 304 and entry is not None:
+            body = entry[2]
+            etag = response.headers.get("ETag", entry[1])
+        else:
+            body = response.content
+            if response.status_code != 200:
+                return body
+            etag = response.headers.get("ETag")
+
+        cache = self._cache
+        # Threads from vector_search_many share the cache, so eviction and
+        # insertion must not interleave
+        with self._cache_lock:
+            if (
+                isinstance(cache, dict)
+                and key not in cache
+                and len(cache) >= _CACHE_MAXSIZE
+            ):
+                # Evict the oldest entry
+                del cache[next(iter(cache))]
+            cache[key] = (time.time(), etag, body)
+        return body
+
     @staticmethod
     def configure_logging(level=logging.INFO, filename=None):
         """Configure logging for debugging purposes."""
@@ -36,119 +613,115 @@ class NexusDB:
         logger.addHandler(handler)
         logger.propagate = False
 
-    def _process_response(self, response, tabulate_option: bool, include_types: bool):
-        if not response.text:
+    def _process_response(
+        self,
+        body: bytes,
+        tabulate_option: bool,
+        include_types: bool,
+        tablefmt: str = "simple",
+    ):
+        # Works on the raw response bytes; the body is only decoded to str
+        # when it is returned as-is or reported in an error.
+        if not body:
             error = "Error: Empty response from server"
             return error
 
         try:
-            response_data = response.json()
+            response_data = _loads(body)
             if "headers" in response_data and "rows" in response_data:
                 headers = response_data["headers"]
                 rows = response_data["rows"]
 
-                def extract_value_and_type(cell):
-                    if isinstance(cell, dict):
-                        for key, value in cell.items():
-                            if key == "Num":
-                                if "Int" in value:
-                                    return value["Int"], "Int"
-                                elif "Float" in value:
-                                    return value["Float"], "Float"
-                            elif key == "Str":
-                                return value, "Str"
-                            elif key == "Bool":
-                                return value, "Bool"
-                            elif key == "Uuid":
-                                return value, "Uuid"
-                            elif key == "Json":
-                                return value, "Json"
-                            elif key == "List":
-                                # Recursively process nested lists
-                                return [
-                                    extract_value_and_type(item)[0] for item in value
-                                ], "List"
-                        return str(cell), "Unknown"
-                    return cell, "Unknown"
+                if include_types and not tabulate_option:
+                    # Typed rows are returned as-is: hand back the server's JSON
+                    # instead of extracting cells and re-encoding it
+                    return body.decode()
+
+                simplified_rows = []
+                column_types = None
+                remaining_rows = iter(rows)
+                if tabulate_option:
+                    # Column types come from the first row, in the same pass
+                    # that extracts its values
+                    for row in remaining_rows:
+                        simplified_row = []
+                        column_types = []
+                        for cell in row:
+                            value, cell_type = _extract_value_and_type(cell)
+                            simplified_row.append(value)
+                            column_types.append(cell_type)
+                        simplified_rows.append(simplified_row)
+                        break
+                simplified_rows.extend(
+                    [_simplify_cell(cell) for cell in row] for row in remaining_rows
+                )
 
                 if include_types:
-                    if rows:
-                        # Extract types from the first row
-                        first_row = rows[0]
-                        typed_headers = [
-                            f"{headers[i]} ({extract_value_and_type(cell)[1]})"
-                            for i, cell in enumerate(first_row)
-                        ]
+                    if column_types is not None:
+                        typed_headers = _typed_headers(
+                            tuple(headers), tuple(column_types)
+                        )
                     else:
                         typed_headers = headers
 
-                simplified_rows = [
-                    [extract_value_and_type(cell)[0] for cell in row] for row in rows
-                ]
-
                 if tabulate_option:
-                    if include_types:
-                        return tabulate(simplified_rows, headers=typed_headers)
-                    else:
-                        return tabulate(simplified_rows, headers=headers)
+                    # Columns known to hold strings skip tabulate's number parsing,
+                    # so values like "0012" render verbatim and left-aligned
+                    disable_numparse = (
+                        _string_columns(tuple(column_types))
+                        if column_types is not None
+                        else False
+                    )
+                    table = _LazyTable(
+                        simplified_rows,
+                        typed_headers if include_types else headers,
+                        tablefmt,
+                        disable_numparse,
+                    )
+                    # Only tabulate="lazy" defers rendering; True returns a str
+                    return table if tabulate_option == "lazy" else str(table)
                 else:
-                    if include_types:
-                        return json.dumps(response_data)
-                    else:
-                        # Modify the response to exclude types
-                        response_data["rows"] = simplified_rows
-                        return json.dumps(response_data)
+                    # Modify the response to exclude types
+                    response_data["rows"] = simplified_rows
+                    return _dumps(response_data).decode()
             else:
-                return response.text
-        except json.JSONDecodeError:
-            error = f"Error: Response: {response.text} could not be decoded as JSON"
+                return body.decode()
+        except json.JSONDecodeError:  # orjson.JSONDecodeError subclasses this
+            text = body.decode(errors="replace")
+            error = f"Error: Response: {text} could not be decoded as JSON"
             return error
 
-    def create(self, relation_name, columns):
-        """Creates a new relation with the specified columns, making adjustments for optional parameters."""
+    def _build_create(self, relation_name, columns):
+        """Builds the payload for :meth:`create`."""
         formatted_columns = []
+        primary_seen = False
 
-        # Assume the first column is primary if none is specified
-        primary_seen = any(
-            "is_primary" in column and column["is_primary"] for column in columns
-        )
-
-        for i, column in enumerate(columns):
-            # Apply defaults for missing 'type' and 'default'
-            column_type = column.get("type", "Any?")
-            column_default = column.get("default", None)
-
-            # If is_primary is not specified, only the first column is assumed to be primary (if no other primary is set)
-            if "is_primary" not in column:
-                column_is_primary = not primary_seen and i == 0
-                if column_is_primary:
-                    primary_seen = True  # Mark that a primary column has been set
-            else:
-                column_is_primary = column["is_primary"]
+        for column in columns:
+            # Apply defaults for missing 'type', 'default' and 'is_primary'
+            column_is_primary = column.get("is_primary", False)
+            if column_is_primary:
+                primary_seen = True
 
             formatted_columns.append(
                 {
                     "name": column["name"],
-                    "type": column_type,
-                    "default": column_default,
+                    "type": column.get("type", "Any?"),
+                    "default": column.get("default", None),
                     "is_primary": column_is_primary,
                 }
             )
 
-        data = {
+        # Assume the first column is primary if none is specified
+        if formatted_columns and not primary_seen and "is_primary" not in columns[0]:
+            formatted_columns[0]["is_primary"] = True
+
+        return {
             "query_type": "Create",
             "relation_name": relation_name,
             "fields": formatted_columns,
         }
 
-        logger.debug(
-            f"Creating relation {relation_name} with columns: {formatted_columns}"
-        )
-        response = requests.post(self.base_url, headers=self.headers, json=data)
-        logger.debug(f"Create response: {response.text}")
-        return response.text
-
-    def modify_data(
+    def _build_modify(
         self,
         operation_type,
         relation_name,
@@ -159,22 +732,9 @@ class NexusDB:
         access_keys=None,
         metadata=None,
         references=None,
+        embedding_dtype=None,
     ):
-        """
-        Modifies data in the specified relation, handling insert, upsert, and update operations
-        with optional parameters like embeddings, metadata, etc.
-
-        :param operation_type: The type of operation ("Insert", "Upsert", "Update").
-        :param relation_name: The name of the relation to modify.
-        :param fields: List of fields to include in the operation.
-        :param values: List of values to include in the operation.
-        :param text: Optional text content for vector-based operations.
-        :param embeddings: Optional vector content for vector-based operations.
-        :param access_keys: Optional access keys for authorization.
-        :param metadata: Optional metadata for the operation.
-        :param references: Optional references for the operation.
-        :return: The server's response.
-        """
+        """Builds the payload for :meth:`modify_data`."""
         # Validation logic
         if (fields is None) != (values is None):
             raise ValueError("Both fields and values must be specified together.")
@@ -194,6 +754,8 @@ class NexusDB:
             payload["fields"] = fields
             payload["values"] = values
         if text is not None and embeddings is not None:
+            if embedding_dtype is not None:
+                embeddings = _encode_embeddings(embeddings, embedding_dtype)
             payload["searchable_content"] = {
                 "text": text,
                 "embeddings": embeddings,
@@ -209,12 +771,316 @@ class NexusDB:
                 payload["searchable_content"] = {}
             payload["searchable_content"]["reference"] = references
 
+        return payload
+
+    _build_insert = functools.partialmethod(_build_modify, "Insert")
+    _build_upsert = functools.partialmethod(_build_modify, "Upsert")
+    _build_update = functools.partialmethod(_build_modify, "Update")
+
+    def _build_insert_columnar(self, relation_name, fields, columns):
+        """Builds the payload for :meth:`insert_columnar`."""
+        columns = [_encode_column(column) for column in columns]
+        if len(fields) != len(columns):
+            raise ValueError("fields and columns must have the same length.")
+        lengths = {
+            len(column["codes"]) if isinstance(column, dict) else len(column)
+            for column in columns
+        }
+        if len(lengths) > 1:
+            raise ValueError("All columns must have the same number of values.")
+
+        return {
+            "query_type": "Insert",
+            "relation_name": relation_name,
+            "fields": fields,
+            "columns": columns,
+        }
+
+    def _build_batches(
+        self, operation_type, relation_name, fields, rows, batch_size, max_concurrency
+    ):
+        """
+        Builds the request bodies for :meth:`insert_many` and its variants.
+
+        Returns the serialized payload head shared by every batch and a lazy
+        iterator of row batches; each request body is ``head + values + b"}"``.
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be a positive integer.")
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be a positive integer.")
+        if fields is None:
+            raise ValueError("fields must be specified.")
+
+        # Everything but the values is the same for every batch, so it is
+        # serialized once and each request body is completed by concatenation
+        head = b'{"query_type":%s,"relation_name":%s,"fields":%s,"values":' % (
+            _dumps(operation_type),
+            _dumps(relation_name),
+            _dumps(fields),
+        )
+        rows = iter(rows)
+        return head, iter(lambda: list(islice(rows, batch_size)), [])
+
+    def _build_lookup(self, relation_name, fields=None, condition=""):
+        """Builds the payload for :meth:`lookup`."""
+        return {
+            "query_type": "Lookup",
+            "relation_name": relation_name,
+            "fields": fields if fields is not None else [],
+            "condition": condition,
+        }
+
+    def _build_join(self, join_type, relations, return_fields, option=None):
+        """Builds the payload for :meth:`join`."""
+        data = {
+            "query_type": "Join",
+            "join_type": join_type,
+            "relations": relations,
+            "return": {
+                "fields": return_fields,
+            },
+        }
+
+        if option is not None:
+            data["return"]["option"] = option
+
+        return data
+
+    def _build_delete(self, relation_name, condition):
+        """Builds the payload for :meth:`delete`."""
+        return {
+            "query_type": "Delete",
+            "relation_name": relation_name,
+            "condition": condition,
+        }
+
+    def _build_edit_fields(
+        self,
+        relation_name,
+        fields=None,
+        add_columns=None,
+        condition="",
+        access_keys=None,
+    ):
+        """Builds the payload for :meth:`edit_fields`."""
+        return {
+            "query_type": "ColumnEditor",
+            "relation_name": relation_name,
+            "fields": fields if fields is not None else [],
+            "add_columns": add_columns,
+            "condition": condition,
+            "access_keys": access_keys if access_keys is not None else [],
+        }
+
+    def _build_vector_search(
+        self,
+        query_vector,
+        access_keys=None,
+        search_radius=None,
+        number_of_results=None,
+        filter_statement=None,
+        embedding_dtype=None,
+    ):
+        """Builds the payload for :meth:`vector_search`."""
+        if embedding_dtype is not None:
+            query_vector = _encode_embeddings(query_vector, embedding_dtype)
+
+        query_payload = {
+            "query_type": "VectorSearch",
+            "query_vector": query_vector,
+        }
+
+        if access_keys is not None:
+            query_payload["access_keys"] = access_keys
+        if search_radius is not None:
+            query_payload["search_radius"] = search_radius
+        if number_of_results is not None:
+            query_payload["number_of_results"] = number_of_results
+        if filter_statement is not None:
+            query_payload["filter_statement"] = filter_statement
+
+        return query_payload
+
+    def _build_recursive_query(
+        self, relation_name, source_field, target_field, starting_condition
+    ):
+        """Builds the payload for :meth:`recursive_query`."""
+        relation = {
+            "relation_name": relation_name,
+            "fields": [],  # Will be populated by the server
+            "condition": starting_condition,
+            "defaults": None,
+            "access_keys": None,
+        }
+        return {
+            "query_type": "Recursion",
+            "relation": relation,
+            "source": source_field,
+            "target": target_field,
+        }
+
+
+class NexusDB(_NexusBase):
+    __slots__ = ("_session", "_release", "__weakref__")
+
+    def __init__(
+        self,
+        api_key=None,
+        compression=None,
+        compress_threshold=8192,
+        cache_ttl=0,
+        cache_backend=None,
+    ):
+        """
+        :param api_key: The API key; defaults to the NEXUSDB_API_KEY environment variable.
+        :param compression: Optional Content-Encoding for large request bodies
+                            ("gzip", "zstd" or "br"); the server must accept it.
+        :param compress_threshold: Minimum body size in bytes before compressing.
+        :param cache_ttl: Seconds to reuse responses of identical lookup, join,
+                          vector_search and recursive_query calls; 0 disables caching.
+                          Stale entries are revalidated with the server's ETag.
+        :param cache_backend: Optional mapping used as the cache (any object with
+                              ``get`` and item assignment, e.g. one shared between
+                              workers); defaults to a per-client dict.
+        """
+        super().__init__(
+            api_key, compression, compress_threshold, cache_ttl, cache_backend
+        )
+        self._session = _acquire_session(self.api_key)
+        # Releases the session when the client is closed or garbage collected,
+        # whichever comes first; a finalizer runs at most once
+        self._release = weakref.finalize(self, _release_session, self.api_key)
+
+    def close(self):
+        """
+        Release this client's hold on its pooled connections.
+
+        Clients created with the same API key share a session, which is only
+        closed once every client using it has been closed or garbage collected.
+        The client cannot send queries after it is closed; closing it again
+        does nothing.
+        """
+        self._session = None
+        self._release()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _send(self, payload, stream=False, headers=None):
+        """POST a query payload to the API over the pooled session."""
+        session = self._session
+        if session is None:
+            raise RuntimeError("Cannot send a query on a closed NexusDB client.")
+        body, headers = self._encode(payload, headers)
+        return session.post(
+            self.base_url, data=body, headers=headers, stream=stream
+        )
+
+    def _fetch(self, payload):
+        """Send a read query and return the response body, cached if enabled."""
+        if not self.cache_ttl:
+            return self._send(payload).content
+
+        key = self._cache_key(payload)
+        body, headers = self._cache_check(key)
+        if body is not None:
+            return body
+        return self._cache_store(key, self._send(payload, headers=headers))
+
+    def _post(
+        self,
+        payload,
+        process=False,
+        tabulate=False,
+        include_types=False,
+        tablefmt="simple",
+    ):
+        """
+        Send a query and return its result.
+
+        Read queries (``process=True``) go through the response cache and
+        :meth:`_process_response`; anything else returns the response text.
+        """
+        if not process:
+            text = self._send(payload).text
+            logger.debug("%s response: %s", payload["query_type"], text)
+            return text
+
+        body = self._fetch(payload)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "%s response: %s",
+                payload["query_type"],
+                body.decode(errors="replace"),
+            )
+        return self._process_response(body, tabulate, include_types, tablefmt)
+
+    def create(self, relation_name, columns):
+        """Creates a new relation with the specified columns, making adjustments for optional parameters."""
+        data = self._build_create(relation_name, columns)
+
         logger.debug(
-            f"{operation_type} into {relation_name} with payload: {json.dumps(payload, indent=2)}"
+            "Creating relation %s with columns: %s", relation_name, data["fields"]
         )
-        response = requests.post(self.base_url, headers=self.headers, json=payload)
-        logger.debug(f"{operation_type} response: {response.text}")
-        return response.text
+        return self._post(data)
+
+    def modify_data(
+        self,
+        operation_type,
+        relation_name,
+        fields=None,
+        values=None,
+        text=None,
+        embeddings=None,
+        access_keys=None,
+        metadata=None,
+        references=None,
+        embedding_dtype=None,
+    ):
+        """
+        Modifies data in the specified relation, handling insert, upsert, and update operations
+        with optional parameters like embeddings, metadata, etc.
+
+        :param operation_type: The type of operation ("Insert", "Upsert", "Update").
+        :param relation_name: The name of the relation to modify.
+        :param fields: List of fields to include in the operation.
+        :param values: List of values to include in the operation.
+        :param text: Optional text content for vector-based operations.
+        :param embeddings: Optional vector content for vector-based operations, as a
+                           list of floats or a numpy array (serialized natively).
+        :param access_keys: Optional access keys for authorization.
+        :param metadata: Optional metadata for the operation.
+        :param references: Optional references for the operation.
+        :param embedding_dtype: Optional compact encoding for embeddings ("float32",
+                                "float16" or "int8"); sends base64-packed values
+                                instead of a JSON array. Requires numpy.
+        :return: The server's response.
+        """
+        payload = self._build_modify(
+            operation_type,
+            relation_name,
+            fields,
+            values,
+            text,
+            embeddings,
+            access_keys,
+            metadata,
+            references,
+            embedding_dtype,
+        )
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "%s into %s with payload: %s",
+                operation_type,
+                relation_name,
+                _dumps_indented(payload),
+            )
+        return self._post(payload)
 
     def insert(
         self,
@@ -226,6 +1092,7 @@ class NexusDB:
         access_keys=None,
         metadata=None,
         references=None,
+        embedding_dtype=None,
     ):
         return self.modify_data(
             "Insert",
@@ -237,6 +1104,7 @@ class NexusDB:
             access_keys,
             metadata,
             references,
+            embedding_dtype,
         )
 
     def upsert(
@@ -249,6 +1117,7 @@ class NexusDB:
         access_keys=None,
         metadata=None,
         references=None,
+        embedding_dtype=None,
     ):
         return self.modify_data(
             "Upsert",
@@ -260,6 +1129,7 @@ class NexusDB:
             access_keys,
             metadata,
             references,
+            embedding_dtype,
         )
 
     def update(
@@ -272,6 +1142,7 @@ class NexusDB:
         access_keys=None,
         metadata=None,
         references=None,
+        embedding_dtype=None,
     ):
         return self.modify_data(
             "Update",
@@ -283,6 +1154,90 @@ class NexusDB:
             access_keys,
             metadata,
             references,
+            embedding_dtype,
+        )
+
+    def insert_columnar(self, relation_name, fields, columns):
+        """
+        Inserts rows given column by column instead of row by row.
+
+        String columns with many repeated values are dictionary-encoded, which
+        can shrink payloads such as graph edge lists considerably. Requires a
+        server that accepts the "columns" insert format.
+
+        :param relation_name: The name of the relation to insert into.
+        :param fields: List of field names, one per column.
+        :param columns: List of columns, each a sequence of values for one field.
+        :return: The response from the server.
+        """
+        return self._post(self._build_insert_columnar(relation_name, fields, columns))
+
+    def _modify_many(
+        self, operation_type, relation_name, fields, rows, batch_size, max_concurrency
+    ):
+        head, batches = self._build_batches(
+            operation_type, relation_name, fields, rows, batch_size, max_concurrency
+        )
+        if max_concurrency == 1:
+            return [self._send_batch(head, batch) for batch in batches]
+
+        # At most max_concurrency batches are built and in flight at a time, so
+        # a large iterable of rows is never materialized all at once
+        responses = []
+        pending = deque()
+        with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+            try:
+                for batch in batches:
+                    if len(pending) == max_concurrency:
+                        responses.append(pending.popleft().result())
+                    pending.append(executor.submit(self._send_batch, head, batch))
+                while pending:
+                    responses.append(pending.popleft().result())
+            except BaseException:
+                for future in pending:
+                    future.cancel()
+                raise
+        return responses
+
+    def _send_batch(self, head, batch):
+        """Send one batch of rows after the pre-serialized payload ``head``."""
+        response = self._send(head + _dumps(batch) + b"}")
+        logger.debug("Batch of %d rows response: %s", len(batch), response.text)
+        return response.text
+
+    def insert_many(
+        self, relation_name, fields, rows, batch_size=1000, max_concurrency=1
+    ):
+        """
+        Inserts rows in batches, sending one request per ``batch_size`` rows.
+
+        :param relation_name: The name of the relation to insert into.
+        :param fields: List of fields shared by every row.
+        :param rows: Iterable of rows, each a list of values matching ``fields``.
+        :param batch_size: Maximum number of rows sent per request.
+        :param max_concurrency: Maximum number of batches in flight at once. With
+                                more than one, batches may reach the server out
+                                of order.
+        :return: A list with the server's response for each batch, in order.
+        """
+        return self._modify_many(
+            "Insert", relation_name, fields, rows, batch_size, max_concurrency
+        )
+
+    def upsert_many(
+        self, relation_name, fields, rows, batch_size=1000, max_concurrency=1
+    ):
+        """Upserts rows in batches; see :meth:`insert_many`."""
+        return self._modify_many(
+            "Upsert", relation_name, fields, rows, batch_size, max_concurrency
+        )
+
+    def update_many(
+        self, relation_name, fields, rows, batch_size=1000, max_concurrency=1
+    ):
+        """Updates rows in batches; see :meth:`insert_many`."""
+        return self._modify_many(
+            "Update", relation_name, fields, rows, batch_size, max_concurrency
         )
 
     def lookup(
@@ -292,22 +1247,89 @@ class NexusDB:
         condition="",
         tabulate=False,
         include_types=False,
+        tablefmt="simple",
     ):
-        if fields is None:
-            fields = []
+        data = self._build_lookup(relation_name, fields, condition)
+        logger.debug(
+            "Looking up %s with fields: %s and condition: %s",
+            relation_name,
+            data["fields"],
+            condition,
+        )
+        return self._post(data, True, tabulate, include_types, tablefmt)
 
-        data = {
-            "query_type": "Lookup",
-            "relation_name": relation_name,
-            "fields": fields,
-            "condition": condition,
-        }
+    def lookup_stream(self, relation_name, fields=None, condition=""):
+        """
+        Looks up rows as a stream, yielding them one at a time.
+
+        Requests the "ndjson" response format, where the server writes one JSON
+        row per line, so memory use does not grow with the size of the result.
+
+        :param relation_name: The name of the relation to look up.
+        :param fields: Optional list of fields to return.
+        :param condition: Optional condition rows must meet.
+        :return: A generator of rows, each a list of plain cell values.
+        :raises requests.HTTPError: If the server responds with an error status.
+        :raises ValueError: If a line of the response is not a row.
+        """
+        data = self._build_lookup(relation_name, fields, condition)
+        data["format"] = "ndjson"
         logger.debug(
-            f"Looking up {relation_name} with fields: {fields} and condition: {condition}"
+            "Streaming lookup of %s with fields: %s and condition: %s",
+            relation_name,
+            data["fields"],
+            condition,
         )
-        response = requests.post(self.base_url, headers=self.headers, json=data)
-        logger.debug(f"Lookup response: {response.text}")
-        return self._process_response(response, tabulate, include_types)
+        with self._send(data, stream=True) as response:
+            response.raise_for_status()
+            for line in response.iter_lines():
+                if not line:
+                    continue
+                row = _loads(line)
+                if not isinstance(row, list):
+                    raise ValueError(
+                        f"Unexpected line in streamed response: {line.decode(errors='replace')}"
+                    )
+                yield [_simplify_cell(cell) for cell in row]
+
+    def lookup_iter(self, relation_name, fields=None, condition=""):
+        """
+        Looks up rows and yields them one at a time as they are parsed.
+
+        Unlike :meth:`lookup_stream`, this reads the regular response format. When
+        ijson is installed, large responses are parsed incrementally off the
+        socket, so neither the whole body nor its parse tree is held in memory.
+
+        :param relation_name: The name of the relation to look up.
+        :param fields: Optional list of fields to return.
+        :param condition: Optional condition rows must meet.
+        :return: A generator of rows, each a list of plain cell values.
+        :raises requests.HTTPError: If the server responds with an error status.
+        :raises ValueError: If the response holds no rows.
+        """
+        data = self._build_lookup(relation_name, fields, condition)
+        logger.debug(
+            "Iterating lookup of %s with fields: %s and condition: %s",
+            relation_name,
+            data["fields"],
+            condition,
+        )
+        with self._send(data, stream=True) as response:
+            response.raise_for_status()
+            content_length = int(response.headers.get("Content-Length") or 0)
+            if ijson is None or 0 < content_length < _INCREMENTAL_PARSE_THRESHOLD:
+                response_data = _loads(response.content)
+                if not isinstance(response_data, dict) or "rows" not in response_data:
+                    raise ValueError(
+                        f"Unexpected lookup response: {response.content.decode(errors='replace')}"
+                    )
+                rows = response_data["rows"]
+            else:
+                response.raw.decode_content = True
+                rows = _iter_rows(response.raw)
+
+            for row in rows:
+                yield [_simplify_cell(cell) for cell in row]
 
     def join(
         self,
@@ -317,6 +1339,7 @@ class NexusDB:
         option=None,
         tabulate=False,
         include_types=False,
+        tablefmt="simple",
     ):
         """
         Executes a join query with the specified parameters.
@@ -326,39 +1349,29 @@ class NexusDB:
                         Each dictionary should have 'relation_name', 'fields', and optionally 'defaults'.
         :param return_fields: A list of fields to return in the result.
         :param option: Additional options for the join query (e.g., a limit clause).
+        :param tabulate: True to return the result as a table string, or "lazy"
+                         for a table object rendered on first use.
+        :param tablefmt: The tabulate format used when ``tabulate`` is set;
+                         "fast" renders plain scalar tables without tabulate.
         :return: The result of the join query as a JSON object.
         """
-        data = {
-            "query_type": "Join",
-            "join_type": join_type,
-            "relations": relations,
-            "return": {
-                "fields": return_fields,
-            },
-        }
-
-        if option is not None:
-            data["return"]["option"] = option
+        data = self._build_join(join_type, relations, return_fields, option)
 
         logger.debug(
-            f"Executing {join_type} join on relations: {relations} with return fields: {return_fields} and option: {option}"
+            "Executing %s join on relations: %s with return fields: %s and option: %s",
+            join_type,
+            relations,
+            return_fields,
+            option,
         )
-        response = requests.post(self.base_url, headers=self.headers, json=data)
-        logger.debug(f"Join response: {response.text}")
-        return self._process_response(response, tabulate, include_types)
+        return self._post(data, True, tabulate, include_types, tablefmt)
 
     def delete(self, relation_name, condition):
         """Deletes data from the specified relation where condition is met."""
 
-        data = {
-            "query_type": "Delete",
-            "relation_name": relation_name,
-            "condition": condition,
-        }
-        logger.debug(f"Deleting from {relation_name} where condition: {condition}")
-        response = requests.post(self.base_url, headers=self.headers, json=data)
-        logger.debug(f"Delete response: {response.text}")
-        return response.text
+        data = self._build_delete(relation_name, condition)
+        logger.debug("Deleting from %s where condition: %s", relation_name, condition)
+        return self._post(data)
 
     def edit_fields(
         self,
@@ -379,23 +1392,18 @@ class NexusDB:
         :return: The server's response.
         """
         # Prepare the data payload for the request
-        data = {
-            "query_type": "ColumnEditor",
-            "relation_name": relation_name,
-            "fields": fields if fields is not None else [],
-            "add_columns": add_columns,
-            "condition": condition,
-            "access_keys": access_keys if access_keys is not None else [],
-        }
+        data = self._build_edit_fields(
+            relation_name, fields, add_columns, condition, access_keys
+        )
 
         logger.debug(
-            f"Editing fields for {relation_name} with fields: {fields}, add_columns: {add_columns}, condition: {condition}"
+            "Editing fields for %s with fields: %s, add_columns: %s, condition: %s",
+            relation_name,
+            fields,
+            add_columns,
+            condition,
         )
-        # Send the request to the server
-        response = requests.post(self.base_url, headers=self.headers, json=data)
-        logger.debug(f"Edit fields response: {response.text}")
-        # Return the server's response
-        return response.text
+        return self._post(data)
 
     def vector_search(
         self,
@@ -406,29 +1414,44 @@ class NexusDB:
         filter_statement=None,
         tabulate=False,
         include_types=False,
+        tablefmt="simple",
+        embedding_dtype=None,
     ):
-        query_payload = {
-            "query_type": "VectorSearch",
-            "query_vector": query_vector,
-        }
-
-        if access_keys is not None:
-            query_payload["access_keys"] = access_keys
-        if search_radius is not None:
-            query_payload["search_radius"] = search_radius
-        if number_of_results is not None:
-            query_payload["number_of_results"] = number_of_results
-        if filter_statement is not None:
-            query_payload["filter_statement"] = filter_statement
+        query_payload = self._build_vector_search(
+            query_vector,
+            access_keys,
+            search_radius,
+            number_of_results,
+            filter_statement,
+            embedding_dtype,
+        )
 
         logger.debug(
-            f"Performing vector search with access keys: {access_keys}, search radius: {search_radius}, number of results: {number_of_results}, filter statement: {filter_statement}"
-        )
-        response = requests.post(
-            self.base_url, json=query_payload, headers=self.headers
+            "Performing vector search with access keys: %s, search radius: %s, "
+            "number of results: %s, filter statement: %s",
+            access_keys,
+            search_radius,
+            number_of_results,
+            filter_statement,
         )
-        logger.debug(f"Vector search response: {response.text}")
-        return self._process_response(response, tabulate, include_types)
+        return self._post(query_payload, True, tabulate, include_types, tablefmt)
+
+    def vector_search_many(self, query_vectors, max_concurrency=16, **kwargs):
+        """
+        Runs several vector searches concurrently over the pooled session.
+
+        :param query_vectors: Iterable of query vectors.
+        :param max_concurrency: Maximum number of searches in flight at once.
+        :param kwargs: Options passed to :meth:`vector_search` for every query.
+        :return: A list of results, in the same order as ``query_vectors``.
+        """
+        with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+            return list(
+                executor.map(
+                    lambda query_vector: self.vector_search(query_vector, **kwargs),
+                    query_vectors,
+                )
+            )
 
     def recursive_query(
         self,
@@ -438,6 +1461,7 @@ class NexusDB:
         starting_condition,
         tabulate=False,
         include_types=False,
+        tablefmt="simple",
     ):
         """
         Executes a recursive query with the specified parameters.
@@ -447,26 +1471,52 @@ class NexusDB:
         :param target_field: The target field for the recursion.
         :param starting_condition: The starting condition for the recursion.
         :param return_fields: Fields to be returned in the result.
+        :param tabulate: True to return the result as a table string, or "lazy"
+                         for a table object rendered on first use.
+        :param tablefmt: The tabulate format used when ``tabulate`` is set;
+                         "fast" renders plain scalar tables without tabulate.
         :return: The result of the recursive query as a JSON object.
         """
-        relation = {
-            "relation_name": relation_name,
-            "fields": [],  # Will be populated by the server
-            "condition": starting_condition,
-            "defaults": None,
-            "access_keys": None,
-        }
-        data = {
-            "query_type": "Recursion",
-            "relation": relation,
-            "source": source_field,
-            "target": target_field,
-        }
+        data = self._build_recursive_query(
+            relation_name, source_field, target_field, starting_condition
+        )
 
         logger.debug(
-            f"Executing recursive query on relation: {relation_name} with source field: {source_field}, "
-            f"target field: {target_field}, starting condition: {starting_condition}"
+            "Executing recursive query on relation: %s with source field: %s, "
+            "target field: %s, starting condition: %s",
+            relation_name,
+            source_field,
+            target_field,
+            starting_condition,
         )
-        response = requests.post(self.base_url, headers=self.headers, json=data)
-        logger.debug(f"Recursive query response: {response.text}")
-        return self._process_response(response, tabulate, include_types)
+        return self._post(data, True, tabulate, include_types, tablefmt)
+
+    def batch(self, operations):
+        """
+        Sends several queries to the server in a single request.
+
+        :meth:`pipeline` is the supported way to build the operations: it
+        queues queries with the same arguments as the client's own methods and
+        sends them through this method.
+
+        :param operations: List of query payloads, as queued by :meth:`pipeline`.
+        :return: The server's response.
+        """
+        data = {"query_type": "Batch", "operations": operations}
+
+        logger.debug("Sending batch of %s operations", len(operations))
+        return self._post(data)
+
+    def pipeline(self):
+        """
+        Buffers write queries and sends them as one :meth:`batch`.
+
+        Used as a context manager; the batch is sent when the block exits
+        without an exception::
+
+            with db.pipeline() as pipe:
+                pipe.insert("relation", ["id", "name"], [[1, "Item 1"]])
+                pipe.delete("relation", "id = 2")
+            print(pipe.response)
+        """
+        return _Pipeline(self)
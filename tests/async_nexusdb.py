@@ -0,0 +1,49 @@
+import asyncio
+
+from dotenv import load_dotenv
+
+from nexus_python.async_nexusdb import AsyncNexusDB
+
+# Load environment variables from .env file
+load_dotenv()
+
+
+async def main():
+    async with AsyncNexusDB() as nexus_db:
+        # Step 1: Create two relations concurrently
+        columns = [
+            {"name": "id"},
+            {"name": "name"},
+        ]
+        create_responses = await asyncio.gather(
+            nexus_db.create("example_relation_async1", columns),
+            nexus_db.create("example_relation_async2", columns),
+        )
+        print("Create relation responses:", create_responses)
+
+        # Step 2: Insert rows in batches, up to 4 batches in flight
+        fields = ["id", "name"]
+        rows = ([i, f"Item {i}"] for i in range(1000))
+        insert_responses = await nexus_db.insert_many(
+            "example_relation_async1", fields, rows, batch_size=100, max_concurrency=4
+        )
+        print(f"Insert responses ({len(insert_responses)} batches):", insert_responses)
+
+        insert_response = await nexus_db.insert(
+            "example_relation_async2", fields, [[1, "Item 1"]]
+        )
+        print("Insert data response:", insert_response)
+
+        # Step 3: Look up both relations concurrently
+        lookup_responses = await asyncio.gather(
+            nexus_db.lookup(
+                "example_relation_async1", condition="id < 5", tabulate=True
+            ),
+            nexus_db.lookup("example_relation_async2", tabulate=True),
+        )
+        for lookup_response in lookup_responses:
+            print("Lookup response:\n", lookup_response)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
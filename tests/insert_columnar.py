@@ -0,0 +1,45 @@
+from dotenv import load_dotenv
+
+from nexus_python.nexusdb import NexusDB
+
+# Load environment variables from .env file
+load_dotenv()
+
+
+def main():
+    nexus_db = NexusDB()
+
+    # Step 1: Create a relation of graph edges
+    relation_name = "example_edges_columnar"
+    columns = [
+        {"name": "id"},
+        {"name": "source"},
+        {"name": "label"},
+        {"name": "target"},
+    ]
+    create_response = nexus_db.create(relation_name, columns)
+    print("Create relation response:", create_response)
+
+    # Step 2: Insert the edges column by column; the repetitive source and
+    # label columns are sent dictionary-encoded
+    edge_count = 100
+    insert_response = nexus_db.insert_columnar(
+        relation_name,
+        ["id", "source", "label", "target"],
+        [
+            list(range(edge_count)),
+            [f"user_{i % 5}" for i in range(edge_count)],
+            ["about" if i % 2 else "subjectOf" for i in range(edge_count)],
+            [f"post_{i}" for i in range(edge_count)],
+        ],
+    )
+    print("Insert columnar response:", insert_response)
+
+    lookup_response = nexus_db.lookup(relation_name, condition="id < 5", tabulate=True)
+    print("Lookup after insert:\n", lookup_response)
+
+    nexus_db.close()
+
+
+if __name__ == "__main__":
+    main()
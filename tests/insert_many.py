@@ -0,0 +1,41 @@
+from dotenv import load_dotenv
+
+from nexus_python.nexusdb import NexusDB
+
+# Load environment variables from .env file
+load_dotenv()
+
+
+def main():
+    nexus_db = NexusDB()
+
+    # Step 1: Create a new relation
+    relation_name = "example_relation_many"
+    columns = [
+        {"name": "id"},
+        {"name": "name"},
+    ]
+    create_response = nexus_db.create(relation_name, columns)
+    print("Create relation response:", create_response)
+
+    # Step 2: Insert rows from a generator, 100 rows per request
+    fields = ["id", "name"]
+    rows = ([i, f"Item {i}"] for i in range(1000))
+    insert_responses = nexus_db.insert_many(relation_name, fields, rows, batch_size=100)
+    print(f"Insert responses ({len(insert_responses)} batches):", insert_responses)
+
+    # Step 3: Upsert with several batches in flight at once
+    rows = ([i, f"Updated item {i}"] for i in range(0, 1000, 2))
+    upsert_responses = nexus_db.upsert_many(
+        relation_name, fields, rows, batch_size=100, max_concurrency=4
+    )
+    print(f"Upsert responses ({len(upsert_responses)} batches):", upsert_responses)
+
+    lookup_response = nexus_db.lookup(relation_name, condition="id < 5", tabulate=True)
+    print("Lookup after upsert:\n", lookup_response)
+
+    nexus_db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+from dotenv import load_dotenv
+
+from nexus_python.nexusdb import NexusDB
+
+# Load environment variables from .env file
+load_dotenv()
+
+
+def main():
+    nexus_db = NexusDB()
+
+    # Step 1: Create and fill a relation large enough to be parsed incrementally
+    relation_name = "example_relation_iter"
+    columns = [
+        {"name": "id"},
+        {"name": "name"},
+    ]
+    create_response = nexus_db.create(relation_name, columns)
+    print("Create relation response:", create_response)
+
+    rows = ([i, f"Item {i}" * 10] for i in range(50000))
+    insert_responses = nexus_db.insert_many(relation_name, ["id", "name"], rows)
+    print("Insert batches:", len(insert_responses))
+
+    # Step 2: Iterate over the regular lookup response as it is parsed
+    row_count = 0
+    for row in nexus_db.lookup_iter(relation_name, fields=["id", "name"]):
+        if row_count < 5:
+            print("Row:", row)
+        row_count += 1
+    print("Iterated rows:", row_count)
+
+    # An unknown relation is reported instead of yielding no rows
+    try:
+        list(nexus_db.lookup_iter("missing_relation"))
+    except Exception as error:
+        print("Lookup of a missing relation raised:", repr(error))
+
+    nexus_db.close()
+
+
+if __name__ == "__main__":
+    main()
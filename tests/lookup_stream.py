@@ -0,0 +1,37 @@
+from dotenv import load_dotenv
+
+from nexus_python.nexusdb import NexusDB
+
+# Load environment variables from .env file
+load_dotenv()
+
+
+def main():
+    nexus_db = NexusDB()
+
+    # Step 1: Create and fill a relation
+    relation_name = "example_relation_stream"
+    columns = [
+        {"name": "id"},
+        {"name": "name"},
+    ]
+    create_response = nexus_db.create(relation_name, columns)
+    print("Create relation response:", create_response)
+
+    rows = ([i, f"Item {i}"] for i in range(10000))
+    insert_responses = nexus_db.insert_many(relation_name, ["id", "name"], rows)
+    print(f"Insert responses ({len(insert_responses)} batches):", insert_responses)
+
+    # Step 2: Stream the rows back as NDJSON, one row at a time
+    row_count = 0
+    for row in nexus_db.lookup_stream(relation_name, condition="id >= 100"):
+        if row_count < 5:
+            print("Streamed row:", row)
+        row_count += 1
+    print("Streamed rows:", row_count)
+
+    nexus_db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+import base64
+import json
+
+from nexus_python.nexusdb import NexusDB, _encode_column, _encode_embeddings
+
+# Server-free checks of the payload builders: nothing is sent to the API.
+
+
+def check_encode_column():
+    # Below half distinct values: dictionary-encoded
+    column = ["about", "about", "subjectOf", "about", "about"]
+    assert _encode_column(column) == {
+        "dict": ["about", "subjectOf"],
+        "codes": [0, 0, 1, 0, 0],
+    }
+
+    # Exactly half distinct values is sent as a plain list
+    assert _encode_column(["a", "a", "b", "b"]) == ["a", "a", "b", "b"]
+    assert _encode_column(["a", "b"]) == ["a", "b"]
+
+    # Non-string and empty columns are left alone
+    assert _encode_column([1, 1, 1, 1]) == [1, 1, 1, 1]
+    assert _encode_column(["a", "a", "a", None]) == ["a", "a", "a", None]
+    assert _encode_column(iter([])) == []
+    print("_encode_column: ok")
+
+
+def check_build_insert_columnar(nexus_db):
+    payload = nexus_db._build_insert_columnar(
+        "edges", ["source", "label"], [["u1", "u2", "u3"], ["about"] * 3]
+    )
+    assert payload == {
+        "query_type": "Insert",
+        "relation_name": "edges",
+        "fields": ["source", "label"],
+        "columns": [["u1", "u2", "u3"], {"dict": ["about"], "codes": [0, 0, 0]}],
+    }
+
+    for fields, columns in (
+        (["a"], [[1], [2]]),
+        (["a", "b"], [[1, 2], ["x", "x", "x"]]),
+    ):
+        try:
+            nexus_db._build_insert_columnar("edges", fields, columns)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError(f"{fields}, {columns} should be rejected")
+    print("_build_insert_columnar: ok")
+
+
+def check_build_create(nexus_db):
+    def primaries(columns):
+        fields = nexus_db._build_create("r", columns)["fields"]
+        return [field["is_primary"] for field in fields]
+
+    # The first column is primary unless any column says otherwise
+    assert primaries([{"name": "a"}, {"name": "b"}]) == [True, False]
+    assert primaries([{"name": "a"}, {"name": "b", "is_primary": True}]) == [
+        False,
+        True,
+    ]
+    assert primaries([{"name": "a", "is_primary": False}, {"name": "b"}]) == [
+        False,
+        False,
+    ]
+    assert primaries([]) == []
+
+    (field,) = nexus_db._build_create("r", [{"name": "a"}])["fields"]
+    assert field == {"name": "a", "type": "Any?", "default": None, "is_primary": True}
+    print("_build_create: ok")
+
+
+def check_build_batches(nexus_db):
+    rows = ([i, f"name \"{i}\" é"] for i in range(5))
+    head, batches = nexus_db._build_batches("Upsert", "r", ["id", "name"], rows, 2, 1)
+
+    # Each body is the shared head plus one batch of values, as valid JSON
+    bodies = [json.loads(head + json.dumps(batch).encode() + b"}") for batch in batches]
+    assert [len(body["values"]) for body in bodies] == [2, 2, 1]
+    assert bodies[0] == nexus_db._build_upsert(
+        "r", ["id", "name"], [[0, 'name "0" é'], [1, 'name "1" é']]
+    )
+
+    for fields, batch_size, max_concurrency in (
+        (["id"], 0, 1),
+        (["id"], 1, 0),
+        (None, 1, 1),
+    ):
+        try:
+            nexus_db._build_batches(
+                "Insert", "r", fields, [], batch_size, max_concurrency
+            )
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("invalid batch settings should be rejected")
+    print("_build_batches: ok")
+
+
+def check_encode_embeddings():
+    try:
+        import numpy as np
+    except ImportError:
+        print("_encode_embeddings: skipped, numpy is not installed")
+        return
+
+    embedding = np.linspace(-1.0, 1.0, 1536, dtype=np.float32)
+
+    def decode(encoded, dtype):
+        values = np.frombuffer(base64.b64decode(encoded["b64"]), dtype=dtype)
+        assert encoded["dim"] == values.size
+        return values
+
+    float32 = _encode_embeddings(embedding, "float32")
+    assert float32["dtype"] == "f32" and float32["dim"] == embedding.size
+    assert np.array_equal(decode(float32, "<f4"), embedding)
+
+    float16 = _encode_embeddings(embedding.tolist(), "float16")
+    assert float16["dtype"] == "f16"
+    assert np.allclose(decode(float16, "<f2"), embedding, atol=1e-3)
+
+    int8 = _encode_embeddings(embedding, "int8")
+    assert int8["dtype"] == "i8"
+    restored = decode(int8, "i1") * int8["scale"]
+    assert np.abs(restored - embedding).max() <= int8["scale"] / 2 + 1e-6
+
+    # An all-zero vector has no scale to derive and round-trips as zeros
+    zeros = _encode_embeddings([0.0] * 4, "int8")
+    assert not decode(zeros, "i1").any()
+
+    try:
+        _encode_embeddings(embedding, "float64")
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("unknown embedding_dtype should be rejected")
+    print("_encode_embeddings: ok")
+
+
+def main():
+    with NexusDB("payload-check-key") as nexus_db:
+        check_encode_column()
+        check_build_insert_columnar(nexus_db)
+        check_build_create(nexus_db)
+        check_build_batches(nexus_db)
+    check_encode_embeddings()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,35 @@
+from dotenv import load_dotenv
+
+from nexus_python.nexusdb import NexusDB
+
+# Load environment variables from .env file
+load_dotenv()
+
+
+def main():
+    nexus_db = NexusDB()
+
+    relation_name = "example_relation_pipeline"
+    fields = ["id", "name"]
+
+    # Create, insert and delete in a single request
+    with nexus_db.pipeline() as pipe:
+        pipe.create(relation_name, [{"name": "id"}, {"name": "name"}])
+        pipe.insert(relation_name, fields, [[1, "Item 1"], [2, "Item 2"]])
+        pipe.upsert(relation_name, fields, [[3, "Item 3"]])
+        pipe.delete(relation_name, "id = 1")
+    print("Pipeline response:", pipe.response)
+
+    # A pipeline can also be sent explicitly, without the with block
+    pipe = nexus_db.pipeline()
+    pipe.update(relation_name, fields, [[2, "Item 2 (updated)"]])
+    print("Pipeline execute response:", pipe.execute())
+
+    lookup_response = nexus_db.lookup(relation_name, tabulate=True)
+    print("Lookup after pipeline:\n", lookup_response)
+
+    nexus_db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+from nexus_python.nexusdb import NexusDB
+
+# Server-free checks of the read response cache: queries are answered by
+# canned responses instead of the API.
+
+
+class FakeResponse:
+    def __init__(self, content=b"", status_code=200, headers=None):
+        self.content = content
+        self.status_code = status_code
+        self.headers = headers or {}
+
+
+class CannedNexusDB(NexusDB):
+    __slots__ = ("responses", "sent_headers")
+
+    def __init__(self, api_key, responses, **kwargs):
+        super().__init__(api_key, **kwargs)
+        self.responses = list(responses)
+        self.sent_headers = []
+
+    def _send(self, payload, stream=False, headers=None):
+        self.sent_headers.append(headers)
+        return self.responses.pop(0)
+
+
+PAYLOAD = {"query_type": "Lookup", "relation_name": "r", "fields": [], "condition": ""}
+
+
+def check_ttl_and_etag():
+    cache = {}
+    db = CannedNexusDB(
+        "key",
+        [
+            FakeResponse(b"v1", headers={"ETag": '"1"'}),
+            FakeResponse(status_code=304),
+            FakeResponse(b"v2"),
+        ],
+        cache_ttl=60,
+        cache_backend=cache,
+    )
+
+    # A fresh entry is served without a request
+    assert db._fetch(PAYLOAD) == b"v1"
+    assert db._fetch(PAYLOAD) == b"v1"
+    assert db.sent_headers == [None]
+
+    # A stale entry is revalidated by its ETag, and a 304 reuses the body
+    key = db._cache_key(PAYLOAD)
+    cache[key] = (0, *cache[key][1:])
+    assert db._fetch(PAYLOAD) == b"v1"
+    assert db.sent_headers[-1] == {"If-None-Match": '"1"'}
+    assert cache[key][1:] == ('"1"', b"v1")
+
+    # A stale entry without an ETag is fetched again in full
+    cache[key] = (0, None, b"v1")
+    assert db._fetch(PAYLOAD) == b"v2"
+    assert db.sent_headers[-1] is None
+    assert cache[key][2] == b"v2"
+    db.close()
+    print("ttl and etag: ok")
+
+
+def check_errors_not_cached():
+    db = CannedNexusDB(
+        "key",
+        [FakeResponse(b"error", status_code=500), FakeResponse(b"ok")],
+        cache_ttl=60,
+    )
+    assert db._fetch(PAYLOAD) == b"error"
+    assert db._fetch(PAYLOAD) == b"ok"
+    assert len(db.sent_headers) == 2
+    db.close()
+    print("errors not cached: ok")
+
+
+def check_shared_backend_isolation():
+    shared = {}
+    tenant_a = CannedNexusDB(
+        "tenant-a", [FakeResponse(b"a")], cache_ttl=60, cache_backend=shared
+    )
+    tenant_b = CannedNexusDB(
+        "tenant-b", [FakeResponse(b"b")], cache_ttl=60, cache_backend=shared
+    )
+    assert tenant_a._fetch(PAYLOAD) == b"a"
+    assert tenant_b._fetch(PAYLOAD) == b"b"
+    assert len(tenant_a.sent_headers) == len(tenant_b.sent_headers) == 1
+
+    # The same API key against another endpoint does not share entries either
+    other_endpoint = CannedNexusDB(
+        "tenant-a", [FakeResponse(b"c")], cache_ttl=60, cache_backend=shared
+    )
+    other_endpoint.base_url = "https://other.example/query"
+    assert other_endpoint._fetch(PAYLOAD) == b"c"
+
+    # API keys are not stored in the backend in plain text
+    assert not any(b"tenant-a" in key for key in shared)
+    for db in (tenant_a, tenant_b, other_endpoint):
+        db.close()
+    print("shared backend isolation: ok")
+
+
+def main():
+    check_ttl_and_etag()
+    check_errors_not_cached()
+    check_shared_backend_isolation()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+import json
+
+from tabulate import tabulate
+
+from nexus_python.nexusdb import NexusDB, _extract_list, _fast_tabulate, _LazyTable
+
+# Server-free checks of how response rows are extracted and rendered.
+
+
+def check_extract_list():
+    # Lists without tagged cells are returned as they are
+    embedding = [0.1, 0.2, 0.3]
+    assert _extract_list(embedding) is embedding
+
+    cells = [
+        {"Str": "a"},
+        {"Num": {"Int": 1}},
+        {"List": [{"Str": "b"}, {"List": [{"Num": {"Float": 2.5}}]}]},
+        {"List": [1, 2, 3]},
+        {"List": []},
+    ]
+    assert _extract_list(cells) == ["a", 1, ["b", [2.5]], [1, 2, 3], []]
+
+    # Deep nesting is walked without recursion
+    cell = {"Str": "leaf"}
+    for _ in range(5000):
+        cell = {"List": [cell]}
+    value = _extract_list([cell])
+    # Unwrap the outer list and the 5000 nested ones
+    for _ in range(5001):
+        (value,) = value
+    assert value == "leaf"
+    print("_extract_list: ok")
+
+
+def check_fast_tabulate():
+    rendered = _fast_tabulate(
+        [[1, "abc", None], [22.5, "x", True]], ["id", "name", "z"]
+    )
+    assert rendered == (
+        "id    name  z\n"
+        "----  ----  ----\n"
+        "1     abc\n"
+        "22.5  x     True"
+    )
+
+    # Cells that are not one-line scalars, and ragged rows, are left to tabulate
+    assert _fast_tabulate([[[1, 2], "a"]], ["list", "b"]) is None
+    assert _fast_tabulate([["two\nlines"]], ["a"]) is None
+    assert _fast_tabulate([[1, 2]], ["a"]) is None
+
+    rows, headers = [[[1, 2], "a"]], ["list", "b"]
+    fallback = _LazyTable(rows, headers, "fast")
+    assert str(fallback) == tabulate(rows, headers=headers, tablefmt="simple")
+    print("_fast_tabulate: ok")
+
+
+def check_process_response(nexus_db):
+    body = json.dumps(
+        {
+            "headers": ["id", "code"],
+            "rows": [
+                [{"Num": {"Int": 1}}, {"Str": "0012"}],
+                [{"Num": {"Float": 2.5}}, {"Str": "1e3"}],
+            ],
+        }
+    ).encode()
+
+    # Typed JSON is the server's body, untouched
+    assert nexus_db._process_response(body, False, True) == body.decode()
+
+    untyped = json.loads(nexus_db._process_response(body, False, False))
+    assert untyped == {"headers": ["id", "code"], "rows": [[1, "0012"], [2.5, "1e3"]]}
+
+    # tabulate=True returns a str; string columns are not parsed as numbers
+    table = nexus_db._process_response(body, True, True)
+    assert isinstance(table, str)
+    assert table.splitlines()[0].split() == ["id", "(Int)", "code", "(Str)"]
+    assert "0012" in table and "1e3" in table
+
+    # tabulate="lazy" defers rendering but renders the same table
+    lazy = nexus_db._process_response(body, "lazy", True)
+    assert isinstance(lazy, _LazyTable)
+    assert lazy.rows == [[1, "0012"], [2.5, "1e3"]]
+    assert lazy.headers == ("id (Int)", "code (Str)")
+    assert str(lazy) == table
+    assert "\n" not in repr(lazy)
+
+    # Other bodies are passed through or reported
+    assert nexus_db._process_response(b'{"ok":true}', True, False) == '{"ok":true}'
+    assert nexus_db._process_response(b"", True, False).startswith("Error:")
+    assert nexus_db._process_response(b"not json", True, False).startswith("Error:")
+    print("_process_response: ok")
+
+
+def main():
+    check_extract_list()
+    check_fast_tabulate()
+    with NexusDB("response-check-key") as nexus_db:
+        check_process_response(nexus_db)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+import gc
+import threading
+
+import nexus_python.nexusdb as nexusdb
+from nexus_python.nexusdb import NexusDB
+
+# Server-free checks of the pooled sessions shared between clients.
+
+
+def check_shared_until_last_close():
+    first, second = NexusDB("shared-key"), NexusDB("shared-key")
+    session = first._session
+    assert second._session is session
+
+    # Closing one client leaves the session to the other
+    first.close()
+    first.close()
+    assert nexusdb._sessions["shared-key"] == [session, 1]
+
+    second.close()
+    assert "shared-key" not in nexusdb._sessions
+
+    try:
+        second.lookup("relation")
+    except RuntimeError:
+        pass
+    else:
+        raise AssertionError("a closed client must not send queries")
+    print("shared until last close: ok")
+
+
+def check_concurrent_close():
+    keeper, client = NexusDB("race-key"), NexusDB("race-key")
+    threads = [threading.Thread(target=client.close) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    # The session was released exactly once
+    assert nexusdb._sessions["race-key"][1] == 1
+    keeper.close()
+    assert "race-key" not in nexusdb._sessions
+    print("concurrent close: ok")
+
+
+def check_released_on_collection():
+    before = len(nexusdb._sessions)
+    for i in range(5):
+        NexusDB(f"throwaway-{i}")
+    gc.collect()
+    assert len(nexusdb._sessions) == before
+
+    with NexusDB("context-key"):
+        assert "context-key" in nexusdb._sessions
+    assert "context-key" not in nexusdb._sessions
+    print("released on collection: ok")
+
+
+def main():
+    check_shared_until_last_close()
+    check_concurrent_close()
+    check_released_on_collection()
+
+
+if __name__ == "__main__":
+    main()
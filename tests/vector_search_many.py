@@ -0,0 +1,49 @@
+from dotenv import load_dotenv
+from openai import OpenAI
+
+from nexus_python.nexusdb import NexusDB
+
+# Load environment variables from .env file
+load_dotenv()
+
+
+def get_embeddings(texts):
+    client = OpenAI()
+    response = client.embeddings.create(input=texts, model="text-embedding-ada-002")
+    return [item.embedding for item in response.data]
+
+
+def main():
+    nexus_db = NexusDB()
+
+    # Insert a few searchable texts
+    texts = [
+        "nexusdb is a great database.",
+        "Graph queries can follow relations recursively.",
+        "Vector search finds semantically similar text.",
+    ]
+    for text, embedding in zip(texts, get_embeddings(texts)):
+        insert_response = nexus_db.insert(
+            relation_name="relation_name_of_reference",
+            text=text,
+            embeddings=embedding,
+        )
+        print("Insert Response:", insert_response)
+
+    # Run several searches concurrently; results come back in query order
+    queries = [
+        "Which database should I use?",
+        "How do recursive queries work?",
+        "Find similar documents.",
+    ]
+    search_responses = nexus_db.vector_search_many(
+        get_embeddings(queries), max_concurrency=3, number_of_results=2
+    )
+    for query, search_response in zip(queries, search_responses):
+        print(f"Search Response for {query!r}:", search_response)
+
+    nexus_db.close()
+
+
+if __name__ == "__main__":
+    main()